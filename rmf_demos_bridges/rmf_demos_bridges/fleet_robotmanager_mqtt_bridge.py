@@ -119,9 +119,24 @@ class FleetRobotManagerMQTTBridge(Node):
 
         self._init_pubsub()
         self.mqtt_pubs = {}  # Map of robot names to their mqtt Client
+        self.mqtt_topics = {}  # Map of robot names to their mqtt topic
         self._init_mqtt()
         self._init_gps_conversion_tools('svy21')
 
+        # Latest GPS payload waiting to be published, keyed by robot name.
+        # Publishing happens on a dedicated thread so that a slow MQTT broker
+        # does not hold up the ROS callbacks, and only the most recent state
+        # of each robot is sent if several arrive before the broker catches
+        # up. The same thread also runs the network loop of every MQTT client
+        # so that all Paho calls happen on one thread.
+        self._pending_payloads = {}
+        self._pending_lock = threading.Lock()
+        self._pending_event = threading.Event()
+        self._publish_thread = threading.Thread(
+            target=self._publish_loop, daemon=True
+        )
+        self._publish_thread.start()
+
     def robot_state_callback(self, msg: RobotState):
         try:
             if self.args.filter_fleet:
@@ -132,14 +147,37 @@ class FleetRobotManagerMQTTBridge(Node):
                 print(f'Skipping {robot.name} as it does not have auth key')
             else:
                 json = self._robot_state_to_gps_json(robot)
-                rbmgr_uuid = ROBOT_ID_TO_AUTHKEY_MAP[robot.name]
-                self.mqtt_pubs[robot.name].publish(
-                    self.args.mqtt_base_topic + rbmgr_uuid, json
-                )
+                with self._pending_lock:
+                    self._pending_payloads[robot.name] = json
+                self._pending_event.set()
 
         except Exception as e:
             print(e)
 
+    def _publish_loop(self):
+        while True:
+            # Wake up periodically even without new states so that keepalives
+            # and acknowledgements keep being exchanged with the broker
+            self._pending_event.wait(1.0)
+            with self._pending_lock:
+                self._pending_event.clear()
+                pending = self._pending_payloads
+                self._pending_payloads = {}
+
+            for robot_name, json in pending.items():
+                try:
+                    self.mqtt_pubs[robot_name].publish(
+                        self.mqtt_topics[robot_name], json
+                    )
+                except Exception as e:
+                    print(e)
+
+            for mqtt_pub in self.mqtt_pubs.values():
+                try:
+                    mqtt_pub.loop(timeout=0)
+                except Exception as e:
+                    print(e)
+
     def _init_pubsub(self):
         self.robot_state_sub = self.create_subscription(
             RobotState,
@@ -150,9 +188,12 @@ class FleetRobotManagerMQTTBridge(Node):
 
     def _init_mqtt(self):
         try:
-            for robot_name in ROBOT_ID_TO_AUTHKEY_MAP.keys():
+            for robot_name, rbmgr_uuid in ROBOT_ID_TO_AUTHKEY_MAP.items():
+                self.mqtt_topics[robot_name] = (
+                    self.args.mqtt_base_topic + rbmgr_uuid
+                )
                 self.mqtt_pubs[robot_name] = mqtt.Client(
-                    'rbmgr_pub_' + ROBOT_ID_TO_AUTHKEY_MAP[robot_name]
+                    'rbmgr_pub_' + rbmgr_uuid
                 )
                 self.mqtt_pubs[robot_name].connect(self.args.mqtt_server)
         except ConnectionRefusedError as e:
@@ -25,6 +25,7 @@ import enum
 from urllib.error import HTTPError
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class RobotAPIResult(enum.IntEnum):
@@ -46,8 +47,30 @@ class RobotAPI:
         self.prefix = prefix
         self.user = user
         self.password = password
-        self.timeout = 5.0
+        # Separate (connect, read) timeouts in seconds, so that an unreachable
+        # fleet manager is detected quickly while slow responses still have
+        # time to arrive
+        self.timeout = (1.0, 5.0)
         self.debug = False
+        # Reuse connections to the fleet manager across requests instead of
+        # opening a new socket for every status poll and command
+        self.session = requests.Session()
+        self.session.auth = (user, password)
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32, max_retries=0
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # The endpoint URLs only vary by their query values, so build the
+        # fixed part once. The trailing slash matches the fleet manager
+        # routes and avoids a redirect round trip on every request.
+        api = self.prefix + '/open-rmf/rmf_demos_fm/'
+        self._navigate_url = api + 'navigate/?robot_name='
+        self._start_activity_url = api + 'start_activity/?robot_name='
+        self._stop_url = api + 'stop_robot/?robot_name='
+        self._toggle_teleop_url = api + 'toggle_teleop/?robot_name='
+        self._status_url = api + 'status/'
+        self._robot_status_url = api + 'status/?robot_name='
 
     def check_connection(self):
         """Return True if connection to the robot API server is successful."""
@@ -71,21 +94,22 @@ class RobotAPI:
         else False.
         """
         assert len(pose) > 2
-        url = (
-            self.prefix
-            + f'/open-rmf/rmf_demos_fm/navigate?robot_name={robot_name}'
-            f'&cmd_id={cmd_id}'
-        )
-        data = {}  # data fields: task, map_name, destination{}, data{}
-        data['map_name'] = map_name
-        data['destination'] = {'x': pose[0], 'y': pose[1], 'yaw': pose[2]}
-        data['speed_limit'] = speed_limit
+        url = self._navigate_url + robot_name + '&cmd_id=' + str(cmd_id)
+        # data fields: task, map_name, destination{}, data{}
+        data = {
+            'map_name': map_name,
+            'destination': {'x': pose[0], 'y': pose[1], 'yaw': pose[2]},
+            'speed_limit': speed_limit,
+        }
         try:
-            response = requests.post(url, timeout=self.timeout, json=data)
+            response = self.session.post(
+                url, timeout=self.timeout, json=data
+            )
             response.raise_for_status()
+            payload = response.json()
             if self.debug:
-                print(f'Response: {response.json()}')
-            return response.json()['success']
+                print(f'Response: {payload}')
+            return payload['success']
         except HTTPError as http_err:
             print(f'HTTP error for {robot_name} in navigate: {http_err}')
         except Exception as err:
@@ -102,23 +126,22 @@ class RobotAPI:
         For example, load/unload a cart for Deliverybot
         or begin cleaning a zone for a cleaning robot.
         """
-        url = (
-            self.prefix
-            + f'/open-rmf/rmf_demos_fm/start_activity?robot_name={robot_name}'
-            f'&cmd_id={cmd_id}'
-        )
+        url = self._start_activity_url + robot_name + '&cmd_id=' + str(cmd_id)
         # data fields: task, map_name, destination{}, data{}
         data = {'activity': activity, 'label': label}
         try:
-            response = requests.post(url, timeout=self.timeout, json=data)
+            response = self.session.post(
+                url, timeout=self.timeout, json=data
+            )
             response.raise_for_status()
+            payload = response.json()
             if self.debug:
-                print(f'Response: {response.json()}')
+                print(f'Response: {payload}')
 
-            if response.json()['success']:
+            if payload['success']:
                 return (
                     RobotAPIResult.SUCCESS,
-                    response.json()['data']['path'],
+                    payload['data']['path'],
                 )
 
             # If we get a response with success=False, then
@@ -135,17 +158,14 @@ class RobotAPI:
 
         Return True if robot has successfully stopped. Else False
         """
-        url = (
-            self.prefix
-            + f'/open-rmf/rmf_demos_fm/stop_robot?robot_name={robot_name}'
-            f'&cmd_id={cmd_id}'
-        )
+        url = self._stop_url + robot_name + '&cmd_id=' + str(cmd_id)
         try:
-            response = requests.get(url, self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
+            payload = response.json()
             if self.debug:
-                print(f'Response: {response.json()}')
-            return response.json()['success']
+                print(f'Response: {payload}')
+            return payload['success']
         except HTTPError as http_err:
             print(f'HTTP error for {robot_name} in stop: {http_err}')
         except Exception as err:
@@ -158,17 +178,17 @@ class RobotAPI:
 
         Return True if the toggle request is successful
         """
-        url = (
-            self.prefix
-            + f'/open-rmf/rmf_demos_fm/toggle_teleop?robot_name={robot_name}'
-        )
+        url = self._toggle_teleop_url + robot_name
         data = {'toggle': toggle}
         try:
-            response = requests.post(url, timeout=self.timeout, json=data)
+            response = self.session.post(
+                url, timeout=self.timeout, json=data
+            )
             response.raise_for_status()
+            payload = response.json()
             if self.debug:
-                print(f'Response: {response.json()}')
-            return response.json()['success']
+                print(f'Response: {payload}')
+            return payload['success']
         except HTTPError as http_err:
             print(f'HTTP error for {robot_name} in toggle_teleop: {http_err}')
         except Exception as err:
@@ -182,24 +202,26 @@ class RobotAPI:
         Otherwise return a list of RobotUpdateData for all robots.
         """
         if robot_name is None:
-            url = self.prefix + '/open-rmf/rmf_demos_fm/status'
+            url = self._status_url
         else:
-            url = (
-                self.prefix
-                + f'/open-rmf/rmf_demos_fm/status?robot_name={robot_name}'
-            )
+            url = self._robot_status_url + robot_name
         try:
-            response = requests.get(url, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
+            payload = response.json()
             if self.debug:
-                print(f'Response: {response.json()}')
+                print(f'Response: {payload}')
             if robot_name is not None:
-                return RobotUpdateData(response.json()['data'])
-            else:
-                all_robots = []
-                for robot in response.json()['all_robots']:
-                    all_robots.append(RobotUpdateData(robot))
-                return all_robots
+                return RobotUpdateData(payload['data'])
+
+            # The fleet manager only reports all robots once each of them
+            # has published a state
+            if not payload['success']:
+                return None
+            all_robots = []
+            for robot in payload['data']['all_robots']:
+                all_robots.append(RobotUpdateData(robot))
+            return all_robots
         except HTTPError as http_err:
             print(f'HTTP error for {robot_name} in get_data: {http_err}')
         except Exception as err:
@@ -210,13 +232,22 @@ class RobotAPI:
 class RobotUpdateData:
     """Update data for a single robot."""
 
+    __slots__ = (
+        'robot_name',
+        'position',
+        'map',
+        'battery_soc',
+        'requires_replan',
+        'last_request_completed',
+    )
+
     def __init__(self, data):
         self.robot_name = data['robot_name']
         position = data['position']
         x = position['x']
         y = position['y']
         yaw = position['yaw']
-        self.position = [x, y, yaw]
+        self.position = (x, y, yaw)
         self.map = data['map_name']
         self.battery_soc = data['battery'] / 100.0
         self.requires_replan = data.get('replan', False)
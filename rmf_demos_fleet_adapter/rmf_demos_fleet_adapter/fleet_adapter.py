@@ -14,10 +14,11 @@
 
 import argparse
 import asyncio
-import math
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import threading
 import time
+import traceback
 
 import rclpy
 from rclpy.duration import Duration
@@ -141,18 +142,42 @@ def main(argv=sys.argv):
         reassign_task_interval = config_yaml['rmf_fleet'].get(
             'reassign_task_interval', 60)  # seconds
         last_task_replan = node.get_clock().now()
-        asyncio.set_event_loop(asyncio.new_event_loop())
+        loop = asyncio.new_event_loop()
+        # Give every robot its own worker so that the status polls of the
+        # whole fleet are in flight at the same time instead of being queued
+        # behind the default executor's limited number of threads
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=max(1, len(robots)))
+        )
+        asyncio.set_event_loop(loop)
         while rclpy.ok():
             now = node.get_clock().now()
 
+            # Fetch the status of the whole fleet in one request. The
+            # per-robot updates below are then served from that snapshot,
+            # falling back to individual requests if it is unavailable.
+            snapshot = {}
+            all_robots = api.get_data()
+            if all_robots is not None:
+                for data in all_robots:
+                    snapshot[data.robot_name] = data
+
             # Update all the robots in parallel using a thread pool
             update_jobs = []
             for robot in robots.values():
-                update_jobs.append(update_robot(robot))
+                update_jobs.append(
+                    update_robot(robot, snapshot.get(robot.name))
+                )
 
-            asyncio.get_event_loop().run_until_complete(
-                asyncio.wait(update_jobs)
+            results = loop.run_until_complete(
+                asyncio.gather(*update_jobs, return_exceptions=True)
             )
+            for robot, result in zip(robots.values(), results):
+                if isinstance(result, BaseException):
+                    node.get_logger().error(
+                        f'Failed to update robot [{robot.name}]:\n'
+                        + ''.join(traceback.format_exception(result))
+                    )
 
             interval_sec = (now.nanoseconds -
                             last_task_replan.nanoseconds) / 1e9
@@ -372,8 +397,8 @@ class Teleoperation:
         else:
             dx = self.last_position[0] - data.position[0]
             dy = self.last_position[1] - data.position[1]
-            dist = math.sqrt(dx * dx + dy * dy)
-            if dist > 0.1:
+            # Compare squared distances to avoid taking a square root
+            if dx * dx + dy * dy > 0.1 ** 2:
                 print('about to replace override schedule')
                 self.override = self.execution.override_schedule(
                     data.map, [data.position], 30.0
@@ -393,8 +418,9 @@ def parallel(f):
 
 
 @parallel
-def update_robot(robot: RobotAdapter):
-    data = robot.api.get_data(robot.name)
+def update_robot(robot: RobotAdapter, data: RobotUpdateData | None = None):
+    if data is None:
+        data = robot.api.get_data(robot.name)
     if data is None:
         return
 
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import argparse
-import math
 import sys
 import time
 
@@ -46,8 +45,7 @@ def make_location(p, level_name):
 def close(l0: Location, l1: Location):
     x_2 = (l1.x - l0.x) ** 2
     y_2 = (l1.y - l0.y) ** 2
-    dist = math.sqrt(x_2 + y_2)
-    if dist > 0.2:
+    if x_2 + y_2 > 0.2 ** 2:
         return False
     return True
 